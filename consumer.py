@@ -1,35 +1,94 @@
 import asyncio
-from typing import List
+import datetime
+from typing import List, Optional
 
 import telegram
 from bunch import unbunchify
 
 from utils import task_logger
 from utils.common import log, LoggingLevel, log_exception
+from utils.update_queue import UpdateQueue
 from wordle.regex_dict import create_regex_dict
-from wordle.wordle_async import WordleGame, WordleException
+from wordle.wordle_async import (
+    MultiBoardGame, WordleGame, WordleException
+)
 
 
 class Worker:
-    """Task consumer with several workers."""
+    """Task consumer with several workers.
 
-    def __init__(self, bot: telegram.Bot, queue: asyncio.Queue,
-                 concurrent_workers: int):
+    Updates superseded by a newer queued update from the same chat are
+    dropped. Updates older than `update_deadline_secs` are answered with
+    a short notice instead of being solved."""
+
+    expired_notice = ('Your message waited too long in the queue '
+                      'and was skipped. Please send it again.')
+
+    def __init__(self, bot: telegram.Bot, queue: UpdateQueue,
+                 concurrent_workers: int,
+                 update_deadline_secs: Optional[float] = None):
         self.bot = bot
         self.queue = queue
         self.concurrent_workers = concurrent_workers
+        self.update_deadline_secs = update_deadline_secs
+        self.superseded_count: int = 0
+        self.expired_count: int = 0
         self._tasks: List[asyncio.Task] = []
 
+    def _is_expired(self, update: telegram.Update) -> bool:
+        if self.update_deadline_secs is None or not update.message:
+            return False
+        sent: datetime.datetime = update.message.date
+        if sent.tzinfo is None:
+            sent = sent.replace(tzinfo=datetime.timezone.utc)
+        age = datetime.datetime.now(datetime.timezone.utc) - sent
+        return age.total_seconds() > self.update_deadline_secs
+
+    async def shed_update(self, update: telegram.Update) -> bool:
+        """Skip the update if it is superseded or expired.
+        Returns True if the update was shed."""
+        if self.queue.is_superseded(update):
+            self.superseded_count += 1
+            log(__name__, (
+                f'Dropped update {update.update_id} superseded by a newer '
+                f'one from the same chat. '
+                f'Superseded so far: {self.superseded_count}.'
+            ), LoggingLevel.INFO)
+            return True
+        if self._is_expired(update):
+            self.expired_count += 1
+            log(__name__, (
+                f'Update {update.update_id} is older than '
+                f'{self.update_deadline_secs} seconds, skipping it. '
+                f'Expired so far: {self.expired_count}.'
+            ), LoggingLevel.WARNING)
+            try:
+                await self.bot.send_message(update.message.chat_id,
+                                            self.expired_notice)
+            except Exception as e:
+                log_exception(__name__, e, reraise=False)
+            return True
+        return False
+
     async def handle_update(self, update: telegram.Update) -> None:
         log(__name__, f'Got update {unbunchify(update)}', LoggingLevel.INFO)
-        my_game = WordleGame(
-            regex_dict=create_regex_dict(timeout_secs=10), word_length=5
-        )
         if not update.message:
             return
-        attempts: List[str] = update.message.text.split()
+        boards: List[List[str]] = [
+            line.split() for line in update.message.text.splitlines()
+            if line.strip()]
+        regex_dict = create_regex_dict(timeout_secs=10)
+        word_length = 5
         try:
-            response = await my_game.play(attempts)
+            if (len(boards) > 1
+                    and MultiBoardGame.boards_share_guesses(boards)):
+                response = await MultiBoardGame(
+                    regex_dict=regex_dict, word_length=word_length
+                ).play(boards)
+            else:
+                response = await WordleGame(
+                    regex_dict=regex_dict, word_length=word_length
+                ).play([a for b in boards for a in b])
         except WordleException as e:
             await self.bot.send_message(update.message.chat_id,
                                         f'{e}\n\n{WordleGame.rules}')
@@ -43,7 +102,8 @@ class Worker:
         while True:
             try:
                 upd = await self.queue.get()
-                await self.handle_update(upd)
+                if not await self.shed_update(upd):
+                    await self.handle_update(upd)
             except asyncio.CancelledError:
                 log(__name__, (
                     'Cancelling a consumer worker.'
@@ -70,3 +130,7 @@ class Worker:
         await self.queue.join()
         for t in self._tasks:
             t.cancel()
+        log(__name__, (
+            f'Updates shed: {self.superseded_count} superseded, '
+            f'{self.expired_count} expired.'
+        ), LoggingLevel.INFO)
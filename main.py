@@ -2,6 +2,7 @@ import asyncio
 import datetime
 import logging
 import os
+from typing import Optional
 
 import telegram
 from dotenv import load_dotenv
@@ -10,6 +11,7 @@ from telegram.ext import ApplicationBuilder
 from poller_producer import Poller
 from consumer import Worker
 from utils.common import create_root_logger
+from utils.update_queue import UpdateQueue
 
 load_dotenv()
 
@@ -17,12 +19,31 @@ PRACTICUM_TOKEN: str = os.environ['PRACTICUM_TOKEN']
 TELEGRAM_BOT_TOKEN: str = os.environ['TELEGRAM_BOT_TOKEN']
 
 
+def get_update_deadline_secs() -> Optional[float]:
+    """Seconds a queued update may wait before it is skipped.
+    Defaults to 120, an empty, zero or negative value disables the deadline.
+    """
+    value: str = os.environ.get('UPDATE_DEADLINE_SECS', '120')
+    try:
+        deadline_secs: float = float(value or 0)
+    except ValueError as e:
+        raise ValueError(
+            f'UPDATE_DEADLINE_SECS must be a number of seconds, '
+            f'got `{value}`.') from e
+    return deadline_secs if deadline_secs > 0 else None
+
+
+UPDATE_DEADLINE_SECS: Optional[float] = get_update_deadline_secs()
+
+
 class WordleBot:
-    def __init__(self, token: str, n: int):
+    def __init__(self, token: str, n: int,
+                 update_deadline_secs: Optional[float] = None):
         self.bot: telegram.Bot = ApplicationBuilder().token(token).build().bot
-        self.queue: asyncio.Queue = asyncio.Queue()
+        self.queue: UpdateQueue = UpdateQueue()
         self.producer: Poller = Poller(self.bot, self.queue)
-        self.consumer: Worker = Worker(self.bot, self.queue, n)
+        self.consumer: Worker = Worker(
+            self.bot, self.queue, n, update_deadline_secs)
 
     async def start(self):
         await self.producer.start()
@@ -35,7 +56,8 @@ class WordleBot:
 
 def run() -> None:
     loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
-    bot: WordleBot = WordleBot(TELEGRAM_BOT_TOKEN, 2)
+    bot: WordleBot = WordleBot(
+        TELEGRAM_BOT_TOKEN, 2, UPDATE_DEADLINE_SECS)
 
     try:
         print('Bot has been started.')
@@ -0,0 +1,85 @@
+import asyncio
+import datetime
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
+
+from consumer import Worker
+from utils.update_queue import UpdateQueue
+
+NOW = datetime.datetime.now(datetime.timezone.utc)
+HOUR_AGO = NOW - datetime.timedelta(hours=1)
+
+
+class FakeBot:
+    """Records messages sent, optionally failing to send them."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.sent: List[Tuple[int, str]] = []
+
+    async def send_message(self, chat_id: int, text: str) -> None:
+        if self.fail:
+            raise RuntimeError('Telegram is down.')
+        self.sent.append((chat_id, text))
+
+
+def make_update(sent: datetime.datetime, update_id: int = 1,
+                chat_id: int = 10) -> SimpleNamespace:
+    return SimpleNamespace(
+        update_id=update_id,
+        message=SimpleNamespace(chat_id=chat_id, date=sent))
+
+
+def make_worker(deadline_secs: Optional[float],
+                bot: Optional[FakeBot] = None) -> Worker:
+    return Worker(bot, UpdateQueue(), 1, update_deadline_secs=deadline_secs)
+
+
+def shed_all(worker: Worker, updates: List[SimpleNamespace]) -> List[bool]:
+    """Queue all updates, then take them out, recording which were shed."""
+    async def run() -> List[bool]:
+        for update in updates:
+            await worker.queue.put(update)
+        result = []
+        while not worker.queue.empty():
+            result.append(await worker.shed_update(await worker.queue.get()))
+            worker.queue.task_done()
+        return result
+    return asyncio.run(run())
+
+
+def test_is_expired_with_aware_date():
+    worker = make_worker(60)
+    assert worker._is_expired(make_update(HOUR_AGO))
+    assert not worker._is_expired(make_update(NOW))
+
+
+def test_is_expired_treats_naive_date_as_utc():
+    worker = make_worker(60)
+    assert worker._is_expired(make_update(HOUR_AGO.replace(tzinfo=None)))
+    assert not worker._is_expired(make_update(NOW.replace(tzinfo=None)))
+
+
+def test_is_expired_without_deadline():
+    old = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+    assert not make_worker(None)._is_expired(make_update(old))
+
+
+def test_shed_update_drops_superseded_before_checking_expiry():
+    bot = FakeBot()
+    worker = make_worker(60, bot)
+    shed = shed_all(worker, [
+        make_update(HOUR_AGO, update_id=1, chat_id=10),
+        make_update(NOW, update_id=2, chat_id=20),
+        make_update(HOUR_AGO, update_id=3, chat_id=10),
+    ])
+    assert shed == [True, False, True]
+    assert worker.superseded_count == 1
+    assert worker.expired_count == 1
+    assert bot.sent == [(10, Worker.expired_notice)]
+
+
+def test_shed_update_survives_failing_notice():
+    worker = make_worker(60, FakeBot(fail=True))
+    assert shed_all(worker, [make_update(HOUR_AGO)]) == [True]
+    assert worker.expired_count == 1
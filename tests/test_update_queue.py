@@ -0,0 +1,55 @@
+import asyncio
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
+
+from utils.update_queue import UpdateQueue
+
+
+def make_update(update_id: int, chat_id: Optional[int]) -> SimpleNamespace:
+    message = SimpleNamespace(chat_id=chat_id) if chat_id is not None else None
+    return SimpleNamespace(update_id=update_id, message=message)
+
+
+def drain(updates: List[SimpleNamespace]) -> List[Tuple[int, bool]]:
+    """Put all updates into a queue, then take them out, recording
+    whether each one was superseded when taken."""
+    async def run() -> List[Tuple[int, bool]]:
+        queue = UpdateQueue()
+        for update in updates:
+            await queue.put(update)
+        result = []
+        while not queue.empty():
+            update = await queue.get()
+            result.append((update.update_id, queue.is_superseded(update)))
+            queue.task_done()
+        return result
+    return asyncio.run(run())
+
+
+def test_newest_update_of_each_chat_survives():
+    updates = [make_update(1, 10), make_update(2, 20), make_update(3, 10),
+               make_update(4, 30), make_update(5, 20), make_update(6, 10)]
+    assert drain(updates) == [
+        (1, True), (2, True), (3, True), (4, False), (5, False), (6, False)]
+
+
+def test_updates_without_message_are_never_superseded():
+    updates = [make_update(1, None), make_update(2, 10),
+               make_update(3, None)]
+    assert drain(updates) == [(1, False), (2, False), (3, False)]
+
+
+def test_chat_is_forgotten_once_its_newest_update_is_taken():
+    async def run():
+        queue = UpdateQueue()
+        older, newest = make_update(1, 10), make_update(2, 10)
+        await queue.put(older)
+        await queue.put(newest)
+        await queue.get()
+        assert queue.is_superseded(older)
+        await queue.get()
+        assert not queue.is_superseded(older)
+        assert not queue.is_superseded(newest)
+        await queue.put(make_update(3, 10))
+        assert queue.is_superseded(newest)
+    asyncio.run(run())
@@ -0,0 +1,66 @@
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from wordle.regex_dict import RegexDictionary
+from wordle.wordle_async import BadFormatting, MultiBoardGame
+
+WORDS = ['fiats', 'flail', 'koala', 'ghost', 'crane', 'rathe', 'plumb',
+         'blows', 'kollo']
+
+
+class FakeRegexDictionary(RegexDictionary):
+    """Returns a fixed word list, counting the queries made."""
+
+    def __init__(self, words: List[str]):
+        super().__init__(timeout_secs=0)
+        self.words = words
+        self.patterns: List[str] = []
+
+    async def get_word_list(self, pattern) -> Optional[List[str]]:
+        self.patterns.append(pattern)
+        return self.words
+
+
+def play(boards: List[List[str]]):
+    regex_dict = FakeRegexDictionary(WORDS)
+    game = MultiBoardGame(regex_dict, word_length=5)
+    return game, regex_dict, asyncio.run(game.play(boards))
+
+
+def test_boards_are_solved_with_one_dictionary_query():
+    game, regex_dict, response = play([
+        ['Fundi?', 'ra?the'],
+        ['fundi', 'ra?the'],
+        ['fundi', 'RATHE'],
+    ])
+    assert len(regex_dict.patterns) == 1
+    assert game._possible_solutions == [['flail'], ['koala'], ['rathe']]
+    assert 'Board 1 possible solutions:\n\nflail' in response
+    assert 'Board 2 possible solutions:\n\nkoala' in response
+    assert 'Board 3 is solved: rathe' in response
+
+
+def test_helpers_are_ranked_over_unsolved_boards():
+    game, _, _ = play([
+        ['Fundi?', 'ra?the'],
+        ['fundi', 'ra?the'],
+        ['fundi', 'RATHE'],
+    ])
+    # 'l' scores 2 on board 1 and 1 on board 2, 'o' and 'k' score 1 on
+    # board 2, words without repeated letters get 1000 on top.
+    assert game._helpers[:3] == [
+        ('blows', 1004), ('plumb', 1003), ('ghost', 1001)]
+    assert len(game._helpers) == len(WORDS)
+
+
+def test_boards_must_share_guesses():
+    with pytest.raises(BadFormatting):
+        play([['Fundi?'], ['ra?the']])
+
+
+def test_boards_share_guesses():
+    assert MultiBoardGame.boards_share_guesses(
+        [['Fundi?', 'ra?the'], ['fuNdi', 'rathE']])
+    assert not MultiBoardGame.boards_share_guesses([['Fundi?'], ['ra?the']])
@@ -0,0 +1,43 @@
+import asyncio
+from typing import Dict, Optional
+
+import telegram
+
+
+def chat_id_of(update: telegram.Update) -> Optional[int]:
+    """Chat an update belongs to, or None for updates without a message."""
+    if not update.message:
+        return None
+    return update.message.chat_id
+
+
+class UpdateQueue(asyncio.Queue):
+    """Queue of updates, remembering the newest queued update of each chat.
+
+    Updates are kept in arrival order, consumers use `is_superseded` to skip
+    the ones made obsolete by a newer update from the same chat."""
+
+    def _init(self, maxsize: int) -> None:
+        super()._init(maxsize)
+        self._newest: Dict[int, int] = {}
+
+    def _put(self, item: telegram.Update) -> None:
+        super()._put(item)
+        chat_id = chat_id_of(item)
+        if chat_id is not None:
+            self._newest[chat_id] = max(
+                item.update_id, self._newest.get(chat_id, item.update_id))
+
+    def _get(self) -> telegram.Update:
+        item: telegram.Update = super()._get()
+        chat_id = chat_id_of(item)
+        if chat_id is not None and self._newest.get(chat_id) == item.update_id:
+            del self._newest[chat_id]
+        return item
+
+    def is_superseded(self, update: telegram.Update) -> bool:
+        """True if a newer update from the same chat is still queued."""
+        chat_id = chat_id_of(update)
+        if chat_id is None:
+            return False
+        return self._newest.get(chat_id, update.update_id) > update.update_id
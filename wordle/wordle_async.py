@@ -9,6 +9,7 @@ from wordle.regex_dict import RegexDictionary, create_regex_dict
 from wordle.reports import unique_words_played
 
 ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+DEFAULT_WORD_SCORE = 1000
 
 
 class WordleException(Exception):
@@ -23,6 +24,17 @@ class BadFormatting(BadUserInput):
     pass
 
 
+def rank_words(words, chars_ranked: Dict[str, int]
+               ) -> List[Tuple[str, int]]:
+    """Rank words based on letter scores given by `chars_ranked`.
+    Words with duplicated letters are downgraded."""
+    ranks = {
+        w: sum(chars_ranked.get(c, 0) for c in w
+               ) + DEFAULT_WORD_SCORE * (max(Counter(w).values()) == 1)
+        for w in words}
+    return sorted(ranks.items(), key=lambda i: i[1], reverse=True)
+
+
 class WordleGame:
     """Suggest next move from user attempts expressed in user notation"""
 
@@ -45,7 +57,17 @@ but not in the 5th and 2nd positions, respectively.
 
 - All the other letters, that are in the lower case
 and not followed by '?', are missing from the solution.
-In the example, it's letters 'u', 'n', 'd', 'r', 't', 'h' and 'e'."""
+In the example, it's letters 'u', 'n', 'd', 'r', 't', 'h' and 'e'.
+
+For multi-board games (Dordle, Quordle) put each board on its own
+line, listing the same words in the same order:
+
+    Fundi? ra?the
+    fuNdi rathE
+
+A message is read as several boards only if every line lists the same
+words in the same order, otherwise all lines are read as attempts
+on a single board."""
 
     _displayed_words_max_count = 10
 
@@ -60,16 +82,13 @@ In the example, it's letters 'u', 'n', 'd', 'r', 't', 'h' and 'e'."""
         self._missing: Set[str] = set()
         self._found: Dict[int, str] = {}
         self._regex_dict = regex_dict
-        self._default_word_score = 1000
+        self._default_word_score = DEFAULT_WORD_SCORE
 
     async def play(self, attempts: List[str]) -> Optional[str]:
         """Provide suggestions for the next move based on previous attempts'
         results"""
 
-        self._check_attempts_formatting(attempts)
-        self._attempts = attempts
-
-        self._process_attempts()
+        self.load_attempts(attempts)
 
         word_list = await self._regex_dict.get_word_list(
             self._get_possibles_regex_dict_pattern())
@@ -79,39 +98,35 @@ In the example, it's letters 'u', 'n', 'd', 'r', 't', 'h' and 'e'."""
             ))
             return None
 
-        self._possible_solutions = [
-            w for w in word_list if not (set(self._present.keys()) - set(w))]
+        self._possible_solutions = self._filter_present(word_list)
         if not self._possible_solutions:
             log_exception(__name__, WordleException(
                 'No words were found to match all of your attempts.'
             ))
             return None
 
-        unknown_chars_ranked: Dict[str, int] = {
-            l: c for l, c in
-            sorted(Counter(''.join(self._possible_solutions)).items(),
-                   key=lambda kv: kv[1], reverse=True)
-            if l not in self._found.values() and l not in self._present}
+        unknown_chars_ranked = self.rank_unknown_chars(
+            self._possible_solutions)
 
         unknown_chars: str = ''.join(unknown_chars_ranked.keys())
         helpers_for_unknown: Optional[List[str]] = (
             await self._regex_dict.get_word_list(
                 '^[' + unknown_chars + ']{' + str(self._word_length) + '}$'))
         if helpers_for_unknown:
-            self._unknown_letters_helpers = self._rank_words(
+            self._unknown_letters_helpers = rank_words(
                 helpers_for_unknown, unknown_chars_ranked)
 
         helpers_mixed: Optional[List[str]] = (
             await self._regex_dict.get_word_list(
                 '^[' + ALPHABET + ']{' + str(self._word_length) + '}$'))
         if helpers_mixed:
-            self._mixed_letters_helpers = self._rank_words(
+            self._mixed_letters_helpers = rank_words(
                 helpers_mixed, unknown_chars_ranked)
 
         ranks_for_positioning = {
             c: self._default_word_score for c in self._present}
         ranks_for_positioning.update(unknown_chars_ranked)
-        self._positioning_helpers = self._rank_words(
+        self._positioning_helpers = rank_words(
             await self._get_positioning_helpers(unknown_chars, self._present),
             ranks_for_positioning)
 
@@ -145,6 +160,18 @@ In the example, it's letters 'u', 'n', 'd', 'r', 't', 'h' and 'e'."""
 
         return '\n'.join(response)
 
+    def load_attempts(self, attempts: List[str]) -> None:
+        """Check attempts expressed in user notation and extract
+        the letters found, present and missing from them."""
+        self._check_attempts_formatting(attempts)
+        self._attempts = attempts
+        self._process_attempts()
+
+    @property
+    def solved(self) -> bool:
+        """True if every letter of the solution is found."""
+        return len(self._found) == self._word_length
+
     def _check_attempts_formatting(self, attempts):
         """Raise value error if any attempts
         do not comply with user notation and word length."""
@@ -171,6 +198,26 @@ In the example, it's letters 'u', 'n', 'd', 'r', 't', 'h' and 'e'."""
                         'Use only latin alphabet characters and `?`.'
                     ))
 
+    def _filter_present(self, words: List[str]) -> List[str]:
+        """Drop words missing any of the letters known to be present."""
+        return [w for w in words if not (set(self._present.keys()) - set(w))]
+
+    def filter_possible_solutions(self, words: List[str]) -> List[str]:
+        """Select possible solutions from a list of words of any pattern,
+        without querying the regex dictionary."""
+        pattern = re.compile(self._get_possibles_regex_dict_pattern())
+        return self._filter_present([w for w in words if pattern.match(w)])
+
+    def rank_unknown_chars(self, possible_solutions: List[str]
+                           ) -> Dict[str, int]:
+        """Count letters not yet uncovered over the possible solutions,
+        most frequent first."""
+        return {
+            l: c for l, c in
+            sorted(Counter(''.join(possible_solutions)).items(),
+                   key=lambda kv: kv[1], reverse=True)
+            if l not in self._found.values() and l not in self._present}
+
     def _get_possibles_regex_dict_pattern(self):
         """Returns regex pattern to input into the regex dictionary to
         get possible solutions from it"""
@@ -237,17 +284,6 @@ In the example, it's letters 'u', 'n', 'd', 'r', 't', 'h' and 'e'."""
                     to_found.append(f'{symbol.lower()}{pos}')
         return ''.join(to_present), set(to_missing), ''.join(to_found)
 
-    def _rank_words(self, words, chars_ranked: Dict[str, int]
-                    ) -> List[Tuple[str, int]]:
-        """Rank words based on letter scores given by `chars_ranked`.
-        Words with duplicated letters are downgraded."""
-        ranks = {
-            w: sum(chars_ranked.get(c, 0) for c in w
-                   ) + self._default_word_score * (
-                       max(Counter(w).values()) == 1)
-            for w in words}
-        return sorted(ranks.items(), key=lambda i: i[1], reverse=True)
-
     async def _get_positioning_helpers(self, _unknown: str, _present: dict):
         """Get a list of words to help player position the letters that
         are known to be present in the solution."""
@@ -260,6 +296,102 @@ In the example, it's letters 'u', 'n', 'd', 'r', 't', 'h' and 'e'."""
         return await self._regex_dict.get_word_list(f'^{"".join(_pattern)}$')
 
 
+class MultiBoardGame:
+    """Suggest next move for several boards (Dordle, Quordle) played
+    with the same guesses. Every board is filtered against one shared word
+    list, so the regex dictionary is queried once regardless of the number
+    of boards."""
+
+    def __init__(self, regex_dict: RegexDictionary, word_length: int):
+        self._word_length = word_length
+        self._regex_dict = regex_dict
+        self._boards: List[WordleGame] = []
+        self._possible_solutions: List[List[str]] = []
+        self._helpers: List[Tuple[str, int]] = []
+
+    async def play(self, boards: List[List[str]]) -> Optional[str]:
+        """Provide suggestions for the next move based on previous attempts'
+        results on every board"""
+
+        if not self.boards_share_guesses(boards):
+            log_exception(
+                __name__, BadFormatting(
+                    'All boards must list the same words in the same '
+                    'order, one board per line.'
+                ))
+        self._boards = []
+        for attempts in boards:
+            game = WordleGame(self._regex_dict, self._word_length)
+            game.load_attempts(attempts)
+            self._boards.append(game)
+
+        word_list = await self._regex_dict.get_word_list(
+            '^[' + ALPHABET + ']{' + str(self._word_length) + '}$')
+        if not word_list:
+            log_exception(__name__, WordleException(
+                'Could not get a list of words to match your attempts.'
+            ))
+            return None
+
+        self._possible_solutions = []
+        combined_ranks: Counter = Counter()
+        for i, game in enumerate(self._boards, 1):
+            possible_solutions = game.filter_possible_solutions(word_list)
+            if not possible_solutions:
+                log_exception(__name__, WordleException(
+                    f'No words were found to match your attempts '
+                    f'on board {i}.'
+                ))
+                return None
+            self._possible_solutions.append(possible_solutions)
+            if not game.solved:
+                combined_ranks.update(
+                    game.rank_unknown_chars(possible_solutions))
+
+        self._helpers = rank_words(word_list, dict(combined_ranks))
+
+        response: str = self.generate_response()
+        log(
+            __name__, (
+                f'Generated multi-board response.\n'
+                f'User input:\n'
+                f'{boards}\n'
+                f'Response:\n'
+                f'{response}'
+            ), LoggingLevel.INFO)
+
+        return response
+
+    def generate_response(self) -> str:
+        response: List[str] = []
+        limit: int = WordleGame._displayed_words_max_count
+
+        for i, (game, possible_solutions) in enumerate(
+                zip(self._boards, self._possible_solutions), 1):
+            if game.solved:
+                response.append(
+                    f'Board {i} is solved: {possible_solutions[0]}\n')
+                continue
+            response.append(f'Board {i} possible solutions:\n')
+            response.extend(possible_solutions[:limit])
+            response.append('')
+
+        if self._helpers:
+            response.append(
+                'Helper words ranked by untried letters '
+                'of all unsolved boards:\n')
+            response.extend(w for w, _ in self._helpers[:limit])
+
+        return '\n'.join(response).rstrip()
+
+    @staticmethod
+    def boards_share_guesses(boards: List[List[str]]) -> bool:
+        """True if all boards list the same words in the same order."""
+        guesses = [[a.lower().replace('?', '') for a in attempts]
+                   for attempts in boards]
+        return all(g == guesses[0] for g in guesses[1:])
+
+
 if __name__ == '__main__':
     create_root_logger()
     my_game = WordleGame(